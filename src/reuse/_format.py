@@ -4,16 +4,24 @@
 
 """Formatting functions primarily for the CLI."""
 
-from textwrap import fill, indent
+from functools import lru_cache
+from textwrap import TextWrapper, indent
 
 WIDTH = 78
 INDENT = 2
 
 
+@lru_cache(maxsize=None)
+def _text_wrapper(width):
+    """Return a :class:`TextWrapper` for *width*, creating it only once."""
+    return TextWrapper(width=width)
+
+
 def fill_paragraph(text, width=WIDTH, indent_width=0):
     """Wrap a single paragraph."""
     return indent(
-        fill(text.strip(), width=width - indent_width), indent_width * " "
+        _text_wrapper(width - indent_width).fill(text.strip()),
+        indent_width * " ",
     )
 
 
@@ -30,20 +38,14 @@ def split_into_paragraphs(text):
     surrounded by empty lines.
     """
     lines = text.splitlines()
-    paragraph = ""
+    paragraph = []
 
     for line in lines:
         if not line:
             if paragraph:
-                yield paragraph
-                paragraph = ""
-            else:
-                continue
+                yield " ".join(paragraph)
+                paragraph = []
         else:
-            if paragraph:
-                padding = " "
-            else:
-                padding = ""
-            paragraph = f"{paragraph}{padding}{line}"
+            paragraph.append(line)
     if paragraph:
-        yield paragraph
+        yield " ".join(paragraph)
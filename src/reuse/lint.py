@@ -7,320 +7,272 @@
 the reports and printing some conclusions.
 """
 
-import contextlib
-import os
 import sys
 from gettext import gettext as _
-from typing import Iterable
 
 from . import __REUSE_version__
 from .project import Project
 from .report import ProjectReport
 
+_BAD_LICENSES_HEADER = _("BAD LICENSES")
+_DEPRECATED_LICENSES_HEADER = _("DEPRECATED LICENSES")
+_LICENSES_WITHOUT_EXTENSION_HEADER = _("LICENSES WITHOUT FILE EXTENSION")
+_MISSING_LICENSES_HEADER = _("MISSING LICENSES")
+_UNUSED_LICENSES_HEADER = _("UNUSED LICENSES")
+_READ_ERRORS_HEADER = _("READ ERRORS")
+_MISSING_CALI_HEADER = _("MISSING COPYRIGHT AND LICENSING INFORMATION")
+_SUMMARY_HEADER = _("SUMMARY")
+
+_DEPRECATED_LICENSES_TEXT = _("The following licenses are deprecated by SPDX:")
+_LICENSES_WITHOUT_EXTENSION_TEXT = _(
+    "The following licenses have no file extension:"
+)
+_UNUSED_LICENSES_TEXT = _("The following licenses are not used:")
+_READ_ERRORS_TEXT = _("Could not read:")
+_MISSING_CALI_TEXT = _(
+    "The following files have no copyright and licensing information:"
+)
+_ONLY_COPYRIGHT_TEXT = _("The following files have no copyright information:")
+_ONLY_LICENSING_TEXT = _("The following files have no licensing information:")
+
+_BAD_LICENSES_LABEL = _("Bad licenses:")
+_DEPRECATED_LICENSES_LABEL = _("Deprecated licenses:")
+_LICENSES_WITHOUT_EXTENSION_LABEL = _("Licenses without file extension:")
+_MISSING_LICENSES_LABEL = _("Missing licenses:")
+_UNUSED_LICENSES_LABEL = _("Unused licenses:")
+_USED_LICENSES_LABEL = _("Used licenses:")
+
+
+def _write_header(header, out=sys.stdout):
+    out.writelines(("# ", header, "\n\n"))
+
+
+def _write_summary_list(label, items, out=sys.stdout):
+    if items:
+        out.writelines(("* ", label, " ", ", ".join(items), "\n"))
+    else:
+        out.writelines(("* ", label, "\n"))
+
 
-def _write_element(element, out=sys.stdout):
-    out.write("* ")
-    out.write(str(element))
+def _lint_licenses_and_files(header, licenses_to_files, licenses, out):
+    """Write a section that lists, for each of the sorted *licenses*, the files
+    in which it was found. Return whether anything was found.
+    """
+    if not licenses_to_files:
+        return False
+
+    _write_header(header, out=out)
+    for lic in licenses:
+        out.writelines((_("'{}' found in:").format(lic), "\n"))
+        out.writelines(
+            f"* {file_}\n" for file_ in sorted(licenses_to_files[lic])
+        )
+        out.write("\n")
     out.write("\n")
 
+    return True
+
+
+def _lint_list(header, text, items, out):
+    """Write a section with the explanatory *text*, followed by all *items*.
+    Return whether there were any items.
+    """
+    if not items:
+        return False
+
+    _write_header(header, out=out)
+    out.writelines((text, "\n"))
+    out.writelines(f"* {item}\n" for item in items)
+    out.write("\n\n")
+
+    return True
+
 
 def lint(report: ProjectReport, out=sys.stdout) -> bool:
     """Lint the entire project."""
-    bad_licenses_result = lint_bad_licenses(report, out)
-    deprecated_result = lint_deprecated_licenses(report, out)
-    extensionless = lint_licenses_without_extension(report, out)
-    missing_licenses_result = lint_missing_licenses(report, out)
-    unused_licenses_result = lint_unused_licenses(report, out)
-    read_errors_result = lint_read_errors(report, out)
-    files_without_cali = lint_files_without_copyright_and_licensing(report, out)
+    success = report.is_compliant
 
-    lint_summary(report, out=out)
+    # A compliant project has nothing to report except the summary.
+    if not success:
+        for linter in _LINTERS:
+            linter(report, out)
 
-    success = not any(
-        any(result)
-        for result in (
-            bad_licenses_result,
-            deprecated_result,
-            extensionless,
-            missing_licenses_result,
-            unused_licenses_result,
-            read_errors_result,
-            files_without_cali,
-        )
-    )
+    lint_summary(report, out=out)
 
-    out.write("\n")
     if success:
-        out.write(
-            _(
-                "Congratulations! Your project is compliant with version"
-                " {} of the REUSE Specification :-)"
-            ).format(__REUSE_version__)
-        )
+        conclusion = _(
+            "Congratulations! Your project is compliant with version"
+            " {} of the REUSE Specification :-)"
+        ).format(__REUSE_version__)
     else:
-        out.write(
-            _(
-                "Unfortunately, your project is not compliant with version "
-                "{} of the REUSE Specification :-("
-            ).format(__REUSE_version__)
-        )
-    out.write("\n")
+        conclusion = _(
+            "Unfortunately, your project is not compliant with version "
+            "{} of the REUSE Specification :-("
+        ).format(__REUSE_version__)
+    out.writelines(("\n", conclusion, "\n"))
 
     return success
 
 
-def lint_bad_licenses(report: ProjectReport, out=sys.stdout) -> Iterable[str]:
+def lint_bad_licenses(report: ProjectReport, out=sys.stdout) -> bool:
     """Lint for bad licenses. Bad licenses are licenses that are not in the
     SPDX License List or do not start with LicenseRef-.
     """
-    bad_files = []
-
-    if report.bad_licenses:
-        out.write("# ")
-        out.write(_("BAD LICENSES"))
-        out.write("\n")
-        for lic, files in sorted(report.bad_licenses.items()):
-            out.write("\n")
-            out.write(_("'{}' found in:").format(lic))
-            out.write("\n")
-            for file_ in sorted(files):
-                bad_files.append(file_)
-                _write_element(file_, out=out)
-        out.write("\n\n")
-
-    return bad_files
+    return _lint_licenses_and_files(
+        _BAD_LICENSES_HEADER,
+        report.bad_licenses,
+        report.sorted_bad_licenses,
+        out,
+    )
 
 
-def lint_deprecated_licenses(
-    report: ProjectReport, out=sys.stdout
-) -> Iterable[str]:
+def lint_deprecated_licenses(report: ProjectReport, out=sys.stdout) -> bool:
     """Lint for deprecated licenses."""
-    deprecated = []
-
-    if report.deprecated_licenses:
-        out.write("# ")
-        out.write(_("DEPRECATED LICENSES"))
-        out.write("\n\n")
-        out.write(_("The following licenses are deprecated by SPDX:"))
-        out.write("\n")
-        for lic in sorted(report.deprecated_licenses):
-            deprecated.append(lic)
-            _write_element(lic, out=out)
-        out.write("\n\n")
-
-    return deprecated
+    return _lint_list(
+        _DEPRECATED_LICENSES_HEADER,
+        _DEPRECATED_LICENSES_TEXT,
+        report.sorted_deprecated_licenses,
+        out,
+    )
 
 
 def lint_licenses_without_extension(
     report: ProjectReport, out=sys.stdout
-) -> Iterable[str]:
+) -> bool:
     """Lint for licenses without extensions."""
-    extensionless = []
-
-    if report.licenses_without_extension:
-        out.write("# ")
-        out.write(_("LICENSES WITHOUT FILE EXTENSION"))
-        out.write("\n\n")
-        out.write(_("The following licenses have no file extension:"))
-        out.write("\n")
-        for __, path in sorted(report.licenses_without_extension.items()):
-            extensionless.append(path)
-            _write_element(path, out=out)
-        out.write("\n\n")
-
-    return extensionless
+    return _lint_list(
+        _LICENSES_WITHOUT_EXTENSION_HEADER,
+        _LICENSES_WITHOUT_EXTENSION_TEXT,
+        [
+            report.licenses_without_extension[lic]
+            for lic in report.sorted_licenses_without_extension
+        ],
+        out,
+    )
 
 
-def lint_missing_licenses(
-    report: ProjectReport, out=sys.stdout
-) -> Iterable[str]:
+def lint_missing_licenses(report: ProjectReport, out=sys.stdout) -> bool:
     """Lint for missing licenses. A license is missing when it is referenced
     in a file, but cannot be found.
     """
-    bad_files = []
-
-    if report.missing_licenses:
-        out.write("# ")
-        out.write(_("MISSING LICENSES"))
-        out.write("\n")
-
-        for lic, files in sorted(report.missing_licenses.items()):
-            out.write("\n")
-            out.write(_("'{}' found in:").format(lic))
-            out.write("\n")
-            for file_ in sorted(files):
-                bad_files.append(file_)
-                _write_element(file_, out=out)
-        out.write("\n\n")
-
-    return bad_files
+    return _lint_licenses_and_files(
+        _MISSING_LICENSES_HEADER,
+        report.missing_licenses,
+        report.sorted_missing_licenses,
+        out,
+    )
 
 
-def lint_unused_licenses(
-    report: ProjectReport, out=sys.stdout
-) -> Iterable[str]:
+def lint_unused_licenses(report: ProjectReport, out=sys.stdout) -> bool:
     """Lint for unused licenses."""
-    unused_licenses = []
-
-    if report.unused_licenses:
-        out.write("# ")
-        out.write(_("UNUSED LICENSES"))
-        out.write("\n\n")
-        out.write(_("The following licenses are not used:"))
-        out.write("\n")
-        for lic in sorted(report.unused_licenses):
-            unused_licenses.append(lic)
-            _write_element(lic, out=out)
-        out.write("\n\n")
-
-    return unused_licenses
+    return _lint_list(
+        _UNUSED_LICENSES_HEADER,
+        _UNUSED_LICENSES_TEXT,
+        report.sorted_unused_licenses,
+        out,
+    )
 
 
-def lint_read_errors(report: ProjectReport, out=sys.stdout) -> Iterable[str]:
+def lint_read_errors(report: ProjectReport, out=sys.stdout) -> bool:
     """Lint for read errors."""
-    bad_files = []
-
-    if report.read_errors:
-        out.write("# ")
-        out.write(_("READ ERRORS"))
-        out.write("\n\n")
-        out.write(_("Could not read:"))
-        out.write("\n")
-        for file_ in report.read_errors:
-            bad_files.append(file_)
-            _write_element(file_, out=out)
-        out.write("\n\n")
-
-    return bad_files
+    return _lint_list(
+        _READ_ERRORS_HEADER,
+        _READ_ERRORS_TEXT,
+        report.sorted_read_errors,
+        out,
+    )
 
 
 def lint_files_without_copyright_and_licensing(
     report: ProjectReport, out=sys.stdout
-) -> Iterable[str]:
+) -> bool:
     """Lint for files that do not have copyright or licensing information."""
-    # TODO: The below three operations can probably be optimised.
-    both = set(report.files_without_copyright) & set(
-        report.files_without_licenses
-    )
-    only_copyright = set(report.files_without_copyright) - both
-    only_licensing = set(report.files_without_licenses) - both
-
-    if any((both, only_copyright, only_licensing)):
-        out.write("# ")
-        out.write(_("MISSING COPYRIGHT AND LICENSING INFORMATION"))
-        out.write("\n\n")
-        if both:
-            out.write(
-                _(
-                    "The following files have no copyright and licensing "
-                    "information:"
-                )
-            )
-            out.write("\n")
-            for file_ in sorted(both):
-                _write_element(file_, out=out)
-            out.write("\n")
-        if only_copyright:
-            out.write(_("The following files have no copyright information:"))
-            out.write("\n")
-            for file_ in sorted(only_copyright):
-                _write_element(file_, out=out)
-            out.write("\n")
-        if only_licensing:
-            out.write(_("The following files have no licensing information:"))
-            out.write("\n")
-            for file_ in sorted(only_licensing):
-                _write_element(file_, out=out)
-            out.write("\n")
+    files_without_copyright = report.files_without_copyright
+    files_without_licenses = report.files_without_licenses
+    if not files_without_copyright and not files_without_licenses:
+        return False
+
+    both = files_without_copyright & files_without_licenses
+    only_copyright = files_without_copyright - both
+    only_licensing = files_without_licenses - both
+
+    _write_header(_MISSING_CALI_HEADER, out=out)
+    if both:
+        out.writelines((_MISSING_CALI_TEXT, "\n"))
+        out.writelines(f"* {file_}\n" for file_ in sorted(both))
+        out.write("\n")
+    if only_copyright:
+        out.writelines((_ONLY_COPYRIGHT_TEXT, "\n"))
+        out.writelines(f"* {file_}\n" for file_ in sorted(only_copyright))
         out.write("\n")
+    if only_licensing:
+        out.writelines((_ONLY_LICENSING_TEXT, "\n"))
+        out.writelines(f"* {file_}\n" for file_ in sorted(only_licensing))
+        out.write("\n")
+    out.write("\n")
 
-    return both | only_copyright | only_licensing
+    return True
 
 
 def lint_summary(report: ProjectReport, out=sys.stdout) -> None:
     """Print a summary for linting."""
-    # pylint: disable=too-many-statements
-    out.write("# ")
-    out.write(_("SUMMARY"))
-    out.write("\n\n")
+    _write_header(_SUMMARY_HEADER, out=out)
 
     file_total = len(report.file_reports)
 
-    out.write("* ")
-    out.write(_("Bad licenses:"))
-    for i, lic in enumerate(sorted(report.bad_licenses)):
-        if i:
-            out.write(",")
-        out.write(" ")
-        out.write(lic)
-    out.write("\n")
-
-    out.write("* ")
-    out.write(_("Deprecated licenses:"))
-    for i, lic in enumerate(sorted(report.deprecated_licenses)):
-        if i:
-            out.write(",")
-        out.write(" ")
-        out.write(lic)
-    out.write("\n")
+    for label, attribute in _SUMMARY_LISTS:
+        _write_summary_list(label, getattr(report, attribute), out=out)
 
-    out.write("* ")
-    out.write(_("Licenses without file extension:"))
-    for i, lic in enumerate(sorted(report.licenses_without_extension)):
-        if i:
-            out.write(",")
-        out.write(" ")
-        out.write(lic)
-    out.write("\n")
-
-    out.write("* ")
-    out.write(_("Missing licenses:"))
-    for i, lic in enumerate(sorted(report.missing_licenses)):
-        if i:
-            out.write(",")
-        out.write(" ")
-        out.write(lic)
-    out.write("\n")
-
-    out.write("* ")
-    out.write(_("Unused licenses:"))
-    for i, lic in enumerate(sorted(report.unused_licenses)):
-        if i:
-            out.write(",")
-        out.write(" ")
-        out.write(lic)
-    out.write("\n")
-
-    out.write("* ")
-    out.write(_("Used licenses:"))
-    for i, lic in enumerate(sorted(report.used_licenses)):
-        if i:
-            out.write(",")
-        out.write(" ")
-        out.write(lic)
-    out.write("\n")
-
-    out.write("* ")
-    out.write(_("Read errors: {count}").format(count=len(report.read_errors)))
-    out.write("\n")
-
-    out.write("* ")
-    out.write(
-        _("Files with copyright information: {count} / {total}").format(
-            count=file_total - len(report.files_without_copyright),
-            total=file_total,
+    out.writelines(
+        (
+            "* ",
+            _("Read errors: {count}").format(count=len(report.read_errors)),
+            "\n",
         )
     )
-    out.write("\n")
-
-    out.write("* ")
-    out.write(
-        _("Files with license information: {count} / {total}").format(
-            count=file_total - len(report.files_without_licenses),
-            total=file_total,
+    out.writelines(
+        (
+            "* ",
+            _("Files with copyright information: {count} / {total}").format(
+                count=report.files_with_copyright_count,
+                total=file_total,
+            ),
+            "\n",
         )
     )
-    out.write("\n")
+    out.writelines(
+        (
+            "* ",
+            _("Files with license information: {count} / {total}").format(
+                count=report.files_with_license_count,
+                total=file_total,
+            ),
+            "\n",
+        )
+    )
+
+
+#: Sections that are printed when the project is not compliant, in order.
+_LINTERS = (
+    lint_bad_licenses,
+    lint_deprecated_licenses,
+    lint_licenses_without_extension,
+    lint_missing_licenses,
+    lint_unused_licenses,
+    lint_read_errors,
+    lint_files_without_copyright_and_licensing,
+)
+
+#: Labels of the summary lines that list licenses, and the report attributes
+#: holding those licenses.
+_SUMMARY_LISTS = (
+    (_BAD_LICENSES_LABEL, "sorted_bad_licenses"),
+    (_DEPRECATED_LICENSES_LABEL, "sorted_deprecated_licenses"),
+    (_LICENSES_WITHOUT_EXTENSION_LABEL, "sorted_licenses_without_extension"),
+    (_MISSING_LICENSES_LABEL, "sorted_missing_licenses"),
+    (_UNUSED_LICENSES_LABEL, "sorted_unused_licenses"),
+    (_USED_LICENSES_LABEL, "sorted_used_licenses"),
+)
 
 
 def add_arguments(parser):
@@ -336,9 +288,9 @@ def run(args, project: Project, out=sys.stdout):
         project, do_checksum=False, multiprocessing=not args.no_multiprocessing
     )
 
-    with contextlib.ExitStack() as stack:
-        if args.quiet:
-            out = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+    if args.quiet:
+        result = report.is_compliant
+    else:
         result = lint(report, out=out)
 
     return 0 if result else 1
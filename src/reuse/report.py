@@ -15,7 +15,7 @@ from hashlib import md5
 from io import StringIO
 from os import PathLike, cpu_count
 from pathlib import Path
-from typing import Iterable, List, NamedTuple, Optional, Set
+from typing import FrozenSet, List, NamedTuple, Optional, Set, TextIO, Tuple
 from uuid import uuid4
 
 from . import __version__
@@ -77,6 +77,8 @@ class ProjectReport:  # pylint: disable=too-many-instance-attributes
         self._used_licenses = None
         self._files_without_licenses = None
         self._files_without_copyright = None
+        self._is_compliant = None
+        self._sorted = {}
 
     def to_dict(self):
         """Turn the report into a json-like dictionary."""
@@ -113,6 +115,23 @@ class ProjectReport:  # pylint: disable=too-many-instance-attributes
         See https://spdx.org/specifications.
         """
         out = StringIO()
+        self.write_bill_of_materials(
+            out,
+            creator_person=creator_person,
+            creator_organization=creator_organization,
+        )
+        return out.getvalue()
+
+    def write_bill_of_materials(
+        self,
+        out: TextIO,
+        creator_person: Optional[str] = None,
+        creator_organization: Optional[str] = None,
+    ) -> None:
+        """Write a bill of materials of the project to *out*.
+
+        See https://spdx.org/specifications.
+        """
         # Write mandatory tags
         out.write("SPDXVersion: SPDX-2.1\n")
         out.write("DataLicense: CC0-1.0\n")
@@ -179,8 +198,6 @@ class ProjectReport:  # pylint: disable=too-many-instance-attributes
                 with (Path(self.path) / path).open(encoding="utf-8") as fp:
                     out.write(f"ExtractedText: <text>{fp.read()}</text>\n")
 
-        return out.getvalue()
-
     @classmethod
     def generate(
         cls,
@@ -268,46 +285,117 @@ class ProjectReport:  # pylint: disable=too-many-instance-attributes
         if self._unused_licenses is not None:
             return self._unused_licenses
 
-        # First collect licenses that are suspected to be unused.
-        suspected_unused_licenses = {
-            lic for lic in self.licenses if lic not in self.used_licenses
-        }
-        # Remove false positives.
+        used_licenses = self.used_licenses
+        # A license is also used if it is referenced with a trailing plus.
         self._unused_licenses = {
             lic
-            for lic in suspected_unused_licenses
-            if f"{lic}+" not in self.used_licenses
+            for lic in self.licenses
+            if lic not in used_licenses and f"{lic}+" not in used_licenses
         }
         return self._unused_licenses
 
     @property
-    def files_without_licenses(self) -> Iterable[PathLike]:
-        """Iterable of paths that have no license information."""
+    def files_without_licenses(self) -> FrozenSet[PathLike]:
+        """Set of paths that have no license information."""
         if self._files_without_licenses is not None:
             return self._files_without_licenses
 
-        self._files_without_licenses = {
+        self._files_without_licenses = frozenset(
             file_report.path
             for file_report in self.file_reports
             if not file_report.spdxfile.licenses_in_file
-        }
+        )
 
         return self._files_without_licenses
 
     @property
-    def files_without_copyright(self) -> Iterable[PathLike]:
-        """Iterable of paths that have no copyright information."""
+    def files_without_copyright(self) -> FrozenSet[PathLike]:
+        """Set of paths that have no copyright information."""
         if self._files_without_copyright is not None:
             return self._files_without_copyright
 
-        self._files_without_copyright = {
+        self._files_without_copyright = frozenset(
             file_report.path
             for file_report in self.file_reports
             if not file_report.spdxfile.copyright
-        }
+        )
 
         return self._files_without_copyright
 
+    @property
+    def files_with_copyright_count(self) -> int:
+        """Number of files that have copyright information."""
+        return len(self.file_reports) - len(self.files_without_copyright)
+
+    @property
+    def files_with_license_count(self) -> int:
+        """Number of files that have license information."""
+        return len(self.file_reports) - len(self.files_without_licenses)
+
+    def _sorted_once(self, name: str) -> Tuple:
+        """Return the sorted contents of the collection attribute *name*. The
+        collection is sorted only once.
+        """
+        if name not in self._sorted:
+            self._sorted[name] = tuple(sorted(getattr(self, name)))
+        return self._sorted[name]
+
+    @property
+    def sorted_bad_licenses(self) -> Tuple[str, ...]:
+        """Sorted identifiers of :attr:`bad_licenses`."""
+        return self._sorted_once("bad_licenses")
+
+    @property
+    def sorted_deprecated_licenses(self) -> Tuple[str, ...]:
+        """Sorted identifiers of :attr:`deprecated_licenses`."""
+        return self._sorted_once("deprecated_licenses")
+
+    @property
+    def sorted_licenses_without_extension(self) -> Tuple[str, ...]:
+        """Sorted identifiers of :attr:`licenses_without_extension`."""
+        return self._sorted_once("licenses_without_extension")
+
+    @property
+    def sorted_missing_licenses(self) -> Tuple[str, ...]:
+        """Sorted identifiers of :attr:`missing_licenses`."""
+        return self._sorted_once("missing_licenses")
+
+    @property
+    def sorted_unused_licenses(self) -> Tuple[str, ...]:
+        """Sorted identifiers of :attr:`unused_licenses`."""
+        return self._sorted_once("unused_licenses")
+
+    @property
+    def sorted_used_licenses(self) -> Tuple[str, ...]:
+        """Sorted identifiers of :attr:`used_licenses`."""
+        return self._sorted_once("used_licenses")
+
+    @property
+    def sorted_read_errors(self) -> Tuple[PathLike, ...]:
+        """Sorted paths of :attr:`read_errors`."""
+        return self._sorted_once("read_errors")
+
+    @property
+    def is_compliant(self) -> bool:
+        """Whether the report contains no issues at all."""
+        if self._is_compliant is not None:
+            return self._is_compliant
+
+        self._is_compliant = not any(
+            (
+                self.bad_licenses,
+                self.deprecated_licenses,
+                self.licenses_without_extension,
+                self.missing_licenses,
+                self.unused_licenses,
+                self.read_errors,
+                self.files_without_copyright,
+                self.files_without_licenses,
+            )
+        )
+
+        return self._is_compliant
+
 
 class _File:  # pylint: disable=too-few-public-methods
     """Represent an SPDX file. Sufficiently enough for our purposes, in any
@@ -82,11 +82,10 @@ def run(args, project: Project, out=sys.stdout) -> int:
             add_license_concluded=args.add_license_concluded,
         )
 
-        out.write(
-            report.bill_of_materials(
-                creator_person=args.creator_person,
-                creator_organization=args.creator_organization,
-            )
+        report.write_bill_of_materials(
+            out,
+            creator_person=args.creator_person,
+            creator_organization=args.creator_organization,
         )
 
     return 0
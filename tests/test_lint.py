@@ -105,11 +105,21 @@ def test_lint_bad_license(fake_repository, stringio):
     report = ProjectReport.generate(project)
     result = lint_bad_licenses(report, out=stringio)
 
-    assert "foo.py" in str(list(result)[0])
+    assert result
     assert "foo.py" in stringio.getvalue()
     assert "bad-license" in stringio.getvalue()
 
 
+def test_lint_no_bad_licenses(fake_repository, stringio):
+    """Nothing is written when there are no bad licenses."""
+    project = Project(fake_repository)
+    report = ProjectReport.generate(project)
+    result = lint_bad_licenses(report, out=stringio)
+
+    assert not result
+    assert not stringio.getvalue()
+
+
 def test_lint_missing_licenses(fake_repository, stringio):
     """A missing license is detected."""
     (fake_repository / "foo.py").write_text("SPDX-License-Identifier: MIT")
@@ -117,7 +127,7 @@ def test_lint_missing_licenses(fake_repository, stringio):
     report = ProjectReport.generate(project)
     result = lint_missing_licenses(report, out=stringio)
 
-    assert "foo.py" in str(list(result)[0])
+    assert result
     assert "foo.py" in stringio.getvalue()
     assert "MIT" in stringio.getvalue()
 
@@ -142,7 +152,7 @@ def test_lint_read_errors(fake_repository, stringio):
     report = ProjectReport.generate(project)
     result = lint_read_errors(report, out=stringio)
 
-    assert "foo.py" in str(list(result)[0])
+    assert result
     assert "foo.py" in stringio.getvalue()
 
 
@@ -153,8 +163,30 @@ def test_lint_files_without_copyright_and_licensing(fake_repository, stringio):
     report = ProjectReport.generate(project)
     result = lint_files_without_copyright_and_licensing(report, out=stringio)
 
-    assert "foo.py" in str(list(result)[0])
+    assert result
     assert "foo.py" in stringio.getvalue()
 
 
+def test_lint_files_without_copyright_or_licensing(fake_repository, stringio):
+    """Files that miss only copyright or only licensing information are listed
+    separately from files that miss both.
+    """
+    (fake_repository / "foo.py").write_text("foo")
+    (fake_repository / "bar.py").write_text("SPDX-License-Identifier: MIT")
+    (fake_repository / "baz.py").write_text("SPDX-FileCopyrightText: Jane Doe")
+    project = Project(fake_repository)
+    report = ProjectReport.generate(project)
+    result = lint_files_without_copyright_and_licensing(report, out=stringio)
+
+    assert result
+    output = stringio.getvalue()
+    assert output.index("no copyright and licensing") < output.index("foo.py")
+    assert (
+        output.index("no copyright information:")
+        < output.index("bar.py")
+        < output.index("no licensing information:")
+        < output.index("baz.py")
+    )
+
+
 # REUSE-IgnoreEnd
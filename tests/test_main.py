@@ -215,6 +215,14 @@ def test_lint_fail_quiet(fake_repository, stringio):
     assert stringio.getvalue() == ""
 
 
+def test_lint_quiet(fake_repository, stringio):
+    """Run a successful lint without output."""
+    result = main(["lint", "--quiet"], out=stringio)
+
+    assert result == 0
+    assert stringio.getvalue() == ""
+
+
 def test_lint_no_file_extension(fake_repository, stringio):
     """If a license has no file extension, the lint fails."""
     (fake_repository / "LICENSES/CC0-1.0.txt").rename(
@@ -378,6 +378,47 @@ def test_generate_project_report_read_error(fake_repository, multiprocessing):
     assert (fake_repository / "bad") in result.read_errors
 
 
+def test_project_report_sorted_licenses(fake_repository):
+    """The sorted license properties are sorted and computed only once."""
+    (fake_repository / "LICENSES/MIT.txt").write_text("foo")
+    (fake_repository / "LICENSES/0BSD.txt").write_text("foo")
+
+    project = Project(fake_repository)
+    result = ProjectReport.generate(project)
+
+    first = result.sorted_unused_licenses
+    assert first == ("0BSD", "MIT")
+    assert result.sorted_unused_licenses is first
+
+
+def test_project_report_files_with_counts(fake_repository):
+    """Files with copyright and license information are counted."""
+    (fake_repository / "foo.py").write_text("SPDX-License-Identifier: MIT")
+    project = Project(fake_repository)
+    result = ProjectReport.generate(project)
+
+    assert result.files_with_copyright_count == len(result.file_reports) - 1
+    assert result.files_with_license_count == len(result.file_reports)
+
+
+def test_project_report_is_compliant(fake_repository):
+    """A project without any issues is compliant."""
+    project = Project(fake_repository)
+    result = ProjectReport.generate(project)
+
+    assert result.is_compliant
+
+
+def test_project_report_is_not_compliant(fake_repository):
+    """A project with an unused license is not compliant."""
+    (fake_repository / "LICENSES/MIT.txt").write_text("foo")
+
+    project = Project(fake_repository)
+    result = ProjectReport.generate(project)
+
+    assert not result.is_compliant
+
+
 def test_generate_project_report_to_dict(fake_repository, multiprocessing):
     """Extremely simple test for ProjectReport.to_dict."""
     project = Project(fake_repository)
@@ -394,4 +435,15 @@ def test_bill_of_materials(fake_repository, multiprocessing):
     report.bill_of_materials()
 
 
+def test_write_bill_of_materials(fake_repository, stringio):
+    """Write a bill of materials directly to a stream."""
+    project = Project(fake_repository)
+    report = ProjectReport.generate(project)
+    report.write_bill_of_materials(stringio)
+
+    result = stringio.getvalue()
+    assert result.startswith("SPDXVersion: SPDX-2.1\n")
+    assert "FileName: ./src/source_code.py\n" in result
+
+
 # REUSE-IgnoreEnd